@@ -13,11 +13,14 @@ class FrameworkConfig(BaseModel):
     """Configuration for the parallel GPT framework."""
     
     num_processors: int = Field(default=3, description="Number of parallel processors to use")
+    quorum: Optional[int] = Field(default=None, description="Number of successful responses to wait for before deciding (default: majority of processors)")
+    min_responses_for_decision: int = Field(default=1, description="Minimum successful responses to aim for before invoking the decision maker; failed processors are retried once to reach it")
     timeout: float = Field(default=30.0, description="Timeout for API requests in seconds")
     max_retries: int = Field(default=2, description="Maximum number of retries for failed requests")
     decision_maker_model: str = Field(default="gpt-4o", description="Model to use for decision making")
     decision_maker_temperature: float = Field(default=0.1, description="Temperature for decision maker")
     decision_maker_prompt: str = Field(default=DECISION_MAKER_PROMPT, description="Prompt for decision maker")
+    use_uvloop: bool = Field(default=True, description="Whether to install uvloop's event loop policy when uvloop is available")
     enable_logging: bool = Field(default=True, description="Whether to enable logging")
     log_level: str = Field(default="INFO", description="Logging level")
     
@@ -28,6 +31,20 @@ class FrameworkConfig(BaseModel):
             raise ValueError("Number of processors must be at least 1")
         return v
     
+    @field_validator('quorum')
+    @classmethod
+    def validate_quorum(cls, v):
+        if v is not None and v < 1:
+            raise ValueError("Quorum must be at least 1")
+        return v
+
+    @field_validator('min_responses_for_decision')
+    @classmethod
+    def validate_min_responses_for_decision(cls, v):
+        if v < 1:
+            raise ValueError("Minimum responses for decision must be at least 1")
+        return v
+
     @field_validator('timeout')
     @classmethod
     def validate_timeout(cls, v):
@@ -106,11 +123,14 @@ class ConfigurationManager:
         """
         return {
             "num_processors": self.config.num_processors,
+            "quorum": self.config.quorum,
+            "min_responses_for_decision": self.config.min_responses_for_decision,
             "timeout": self.config.timeout,
             "max_retries": self.config.max_retries,
             "decision_maker_model": self.config.decision_maker_model,
             "decision_maker_temperature": self.config.decision_maker_temperature,
             "decision_maker_prompt": self.config.decision_maker_prompt[:100] + "..." if len(self.config.decision_maker_prompt) > 100 else self.config.decision_maker_prompt,
+            "use_uvloop": self.config.use_uvloop,
             "logging_enabled": self.config.enable_logging,
             "log_level": self.config.log_level
         }
@@ -3,18 +3,29 @@ Core ParallelLLM class with main processing logic.
 """
 
 import asyncio
+import functools
+import random
+import re
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Type, Union
 from pydantic import BaseModel, Field
+import httpx
 import openai
 from openai import AsyncOpenAI
-import json
+import orjson
 import time
 import logging
 
+try:
+    from openai.lib._parsing import type_to_response_format_param as _type_to_response_format_param
+except ImportError:  # private SDK helper; fall back to beta.parse if it moves
+    _type_to_response_format_param = None
+
 from .config import FrameworkConfig, ConfigurationManager
 from .errors import (
-    ParallelLLMError, ConfigurationError, ProcessingError, 
-    DecisionMakerError, ValidationError, handle_openai_error
+    ParallelLLMError, ConfigurationError, ProcessingError,
+    DecisionMakerError, ValidationError, handle_openai_error,
+    is_retryable_error
 )
 from .prompts import DECISION_MAKER_PROMPT
 from .interfaces import ParallelBeta
@@ -23,18 +34,96 @@ from .interfaces import ParallelBeta
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Retry backoff bounds in seconds
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# OpenAI rate-limit headers carry either plain seconds ("20") or Go-style
+# durations ("250ms", "1s", "6m0s")
+_DURATION_PART_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit reset header into seconds, or None if unparseable."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_RE.findall(value)
+    if not parts or ''.join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNIT_SECONDS[u] for n, u in parts)
 
-class ProcessingResult(BaseModel):
-    """Represents the result of processing a single request."""
-    success: bool = Field(description="Whether the processing was successful")
-    result: Optional[Any] = Field(default=None, description="The processed result if successful")
-    error: Optional[str] = Field(default=None, description="Error message if processing failed")
-    processor_id: Optional[str] = Field(default=None, description="ID of the processor that handled this request")
+# Payload size above which decision-prompt serialization moves off the event
+# loop so in-flight responses keep being read while we encode
+_SERIALIZE_OFFLOAD_THRESHOLD = 64 * 1024
+
+
+def _estimate_payload_size(responses: List[Any]) -> int:
+    """
+    Cheap proxy for the serialized size of a response batch.
 
+    Sums the lengths of top-level string values (the bulk of LLM structured
+    output) at O(fields) cost, instead of building full reprs — which would
+    do the very O(payload) work on the event loop that the executor offload
+    exists to avoid.
+    """
+    total = 0
+    for response in responses:
+        if hasattr(response, '__dict__'):
+            values = vars(response).values()
+        elif isinstance(response, dict):
+            values = response.values()
+        else:
+            values = (response,)
+        for value in values:
+            if isinstance(value, str):
+                total += len(value)
+            elif isinstance(value, (list, tuple)):
+                total += sum(len(v) for v in value if isinstance(v, str))
+    return total
+
+
+def _serialize_batch(responses: List[Any], indent_opt: int) -> List[str]:
+    """Serialize decision-maker responses into numbered JSON blocks."""
+    texts = []
+    for i, response in enumerate(responses):
+        payload = response.model_dump(mode='python') if hasattr(response, 'model_dump') else response
+        response_json = orjson.dumps(payload, option=indent_opt, default=str).decode()
+        texts.append(f"Response {i+1}:\n{response_json}")
+    return texts
+
+
+@dataclass(frozen=True)
+class ProcessingResult:
+    """
+    Represents the result of processing a single request.
 
+    Internal result container only — a plain frozen dataclass instead of a
+    Pydantic model, so constructing one costs no validation pass.
+    """
+    success: bool
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    processor_id: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _response_format_param(response_format: Type[BaseModel]) -> Any:
+    """Convert a Pydantic model to the OpenAI response_format param, once per class."""
+    return _type_to_response_format_param(response_format)
+
+
+# Module-level cache so every ParallelLLM instance reuses the same subclass;
+# building a Pydantic v2 model compiles a new validator/serializer pair in
+# pydantic-core, which is far too expensive to repeat on every batch
+@functools.lru_cache(maxsize=128)
 def _create_reasoning_format(original_format: Type[BaseModel]) -> Type[BaseModel]:
     """Create a new format that includes reasoning field."""
-    
+
     class ReasoningFormat(original_format):
         reasoning: str = Field(description="Step-by-step reasoning for this response")
     
@@ -47,7 +136,17 @@ class ParallelLLM:
     """
     Framework for parallelizing GPT structured output processing with decision maker.
     """
-    
+
+    # Fixed template for the decision maker's user message. Keeping the prefix
+    # byte-identical across calls also improves server-side prompt-cache hits
+    _DECISION_USER_TMPL = """Original Query Context:
+{ctx}
+
+All Responses to Analyze:
+{resp}
+
+Please analyze these responses and return the best one or synthesize a better response using the same format as the original responses."""
+
     def __init__(self, api_key: str, config: Optional[FrameworkConfig] = None):
         """
         Initialize the parallel GPT framework.
@@ -58,11 +157,89 @@ class ParallelLLM:
         """
         self.config = config or FrameworkConfig()
         self.config_manager = ConfigurationManager(self.config)
-        self.openai_client = AsyncOpenAI(api_key=api_key)
+
+        # uvloop's libuv-based loop replaces asyncio's pure-Python scheduler,
+        # which pays off as num_processors grows; optional, so quietly fall
+        # back to the default loop when it isn't installed
+        if self.config.use_uvloop:
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
+        # Size the connection pool to the parallel fan-out so bursts of
+        # num_processors requests reuse warm connections instead of paying a
+        # TCP+TLS handshake each; HTTP/2 multiplexes them over fewer sockets
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.config.num_processors * 4,
+                max_connections=self.config.num_processors * 8,
+                keepalive_expiry=30.0
+            )
+        )
+        # The deadline is enforced by the transport layer (httpx) instead of
+        # wrapping every call in asyncio.wait_for, which would add an extra
+        # Task and timer handle per request; it is passed per call in
+        # _make_single_request so update_config(timeout=...) takes effect
+        self.openai_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=self._http_client
+        )
         
         # Create beta interface for API compatibility
         self.beta = ParallelBeta(self)
 
+        # Cache config-derived decision-maker pieces (rebuilt on update_config)
+        self._rebuild_decision_cache()
+
+    def _rebuild_decision_cache(self) -> None:
+        """Rebuild cached decision-maker message pieces from the current config."""
+        self._decision_system_msg = {
+            "role": "system",
+            "content": self.config.decision_maker_prompt
+        }
+        self._decision_kwargs = {
+            "model": self.config.decision_maker_model,
+            "temperature": self.config.decision_maker_temperature
+        }
+
+    async def close(self) -> None:
+        """Close the OpenAI client and its underlying HTTP connection pool."""
+        await self.openai_client.close()
+        await self._http_client.aclose()
+
+    async def _backoff(self, attempt: int, exc: Exception, prev_sleep: float) -> float:
+        """
+        Sleep before the next retry attempt and return the slept duration.
+
+        Honors the server's Retry-After header for rate limits; otherwise uses
+        decorrelated jitter so num_processors requests that fail together
+        don't all retry at the exact same moment and re-trigger the limit.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            exc: The exception that triggered the retry
+            prev_sleep: Duration slept before the previous attempt
+
+        Returns:
+            The duration slept, to pass as prev_sleep on the next retry
+        """
+        delay = None
+        if isinstance(exc, openai.RateLimitError):
+            response = getattr(exc, 'response', None)
+            if response is not None:
+                delay = _parse_retry_after(
+                    response.headers.get("retry-after")
+                    or response.headers.get("x-ratelimit-reset-requests")
+                )
+
+        if delay is None:
+            delay = random.uniform(_BACKOFF_BASE, min(_BACKOFF_CAP, prev_sleep * 3))
+
+        await asyncio.sleep(delay)
+        return delay
+
     async def _make_single_request(
         self,
         model: str,
@@ -82,45 +259,63 @@ class ParallelLLM:
         Returns:
             Parsed response
         """
+        # Per-call timeout (still transport-enforced by httpx) so config
+        # updates apply to requests made after update_config
+        kwargs.setdefault('timeout', self.config.timeout)
+
+        prev_sleep = _BACKOFF_BASE
         for attempt in range(self.config.max_retries + 1):
             try:
-                completion = await asyncio.wait_for(
-                    self.openai_client.beta.chat.completions.parse(
+                if _type_to_response_format_param is not None:
+                    # beta.parse recomputes the JSON schema for response_format
+                    # on every call; going through the lower-level create API
+                    # with a cached schema param pays that cost once per class
+                    # instead of once per processor per batch
+                    completion = await self.openai_client.chat.completions.create(
                         model=model,
                         messages=messages,
-                        response_format=response_format,
+                        response_format=_response_format_param(response_format),
                         **kwargs
-                    ),
-                    timeout=self.config.timeout
+                    )
+                    message = completion.choices[0].message
+                    refusal = getattr(message, 'refusal', None)
+                    if refusal or message.content is None:
+                        # A refusal is deterministic — retrying just burns
+                        # paid API calls, so fail fast with a type that
+                        # is_retryable_error classifies as non-retryable
+                        raise ValidationError(
+                            f"Model refused to produce structured output: "
+                            f"{refusal or 'no content returned'}"
+                        )
+                    return response_format.model_validate_json(message.content)
+
+                completion = await self.openai_client.beta.chat.completions.parse(
+                    model=model,
+                    messages=messages,
+                    response_format=response_format,
+                    **kwargs
                 )
-                
+
                 return completion.choices[0].message.parsed
-                
-            except asyncio.TimeoutError:
-                if attempt == self.config.max_retries:
+
+            except ValidationError:
+                # Already classified as non-retryable (e.g. a model refusal)
+                raise
+            except Exception as e:
+                if attempt < self.config.max_retries:
+                    # Non-final attempts pay only for the backoff sleep;
+                    # error conversion and string formatting are deferred
+                    # until the last try actually fails
+                    prev_sleep = await self._backoff(attempt, e, prev_sleep)
+                    continue
+
+                if isinstance(e, openai.APITimeoutError):
                     raise ProcessingError(f"Request timed out after {self.config.max_retries + 1} attempts")
-                await asyncio.sleep(2 ** attempt)
-                
-            except openai.RateLimitError as e:
-                if attempt == self.config.max_retries:
+                if isinstance(e, openai.APIError):
                     error = handle_openai_error(e)
-                    error_str = str(error)
-                    logger.error(f"OpenAI Rate Limit Error: {error_str}")
+                    logger.error("OpenAI API Error: %s", error)
                     raise error
-                await asyncio.sleep(2 ** attempt)
-                
-            except openai.APIError as e:
-                if attempt == self.config.max_retries:
-                    error = handle_openai_error(e)
-                    error_str = str(error)
-                    logger.error(f"OpenAI API Error: {error_str}")
-                    raise error
-                await asyncio.sleep(2 ** attempt)
-                
-            except Exception as e:
-                if attempt == self.config.max_retries:
-                    raise ProcessingError(f"Unexpected error: {e}")
-                await asyncio.sleep(2 ** attempt)
+                raise ProcessingError(f"Unexpected error: {e}")
 
     async def _process_parallel_requests(
         self,
@@ -132,36 +327,104 @@ class ParallelLLM:
     ) -> List[Any]:
         """Process multiple parallel requests to the same prompt."""
         try:
+            start = time.monotonic()
             # Use reasoning format if requested
             actual_format = _create_reasoning_format(response_format) if pass_reasoning else response_format
             
-            # Create tasks for parallel processing
-            tasks = []
-            for i in range(self.config.num_processors):
-                task = asyncio.create_task(
+            # Create tasks for parallel processing. Task handles (rather than
+            # bare coroutines) are needed so stragglers can be cancelled at
+            # quorum, but per-task name strings are skipped — they were only
+            # ever used for logging
+            tasks = [
+                asyncio.create_task(
                     self._make_single_request(
                         model=model,
                         messages=messages,
                         response_format=actual_format,
                         **kwargs
-                    ),
-                    name=f"processor_{i}"
+                    )
                 )
-                tasks.append(task)
-            
-            # Wait for all tasks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Filter out exceptions
-            successful_results = []
-            failed_count = 0
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    failed_count += 1
-                    logger.warning(f"Processor {i} failed: {result}")
+                for _ in range(self.config.num_processors)
+            ]
+
+
+            # Collect responses as they complete and stop at quorum instead of
+            # waiting for the slowest processor (majority of processors by default)
+            quorum = self.config.quorum or (self.config.num_processors // 2 + 1)
+            quorum = min(quorum, self.config.num_processors)
+
+            completed = 0
+            for future in asyncio.as_completed(tasks):
+                try:
+                    await future
+                except Exception:
+                    pass
                 else:
-                    successful_results.append(result)
-            
+                    completed += 1
+                    if completed >= quorum:
+                        break
+
+            # Cancel stragglers once quorum is reached, then drain every task
+            # so failures that completed but were never yielded by
+            # as_completed don't trigger "exception was never retrieved"
+            # warnings — and so they are counted below
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            successful_results = [r for r in results if not isinstance(r, BaseException)]
+            failures = [
+                r for r in results
+                if isinstance(r, BaseException) and not isinstance(r, asyncio.CancelledError)
+            ]
+            failed_types = [type(e).__name__ for e in failures]
+
+            # One aggregated warning instead of a log-format call per failure
+            failed_count = len(failed_types)
+            if failed_count:
+                logger.warning(
+                    "%d/%d processors failed: %s",
+                    failed_count, self.config.num_processors, failed_types
+                )
+
+            # Opportunistic recovery: if the batch came up short of the
+            # configured minimum, re-issue only the failed slots once rather
+            # than a full N-wide re-run, provided the overall deadline allows.
+            # Deterministic failures (refusals, bad credentials) are excluded
+            # — re-issuing those would just repeat guaranteed-to-fail calls
+            retryable_count = sum(1 for e in failures if is_retryable_error(e))
+            if retryable_count and len(successful_results) < self.config.min_responses_for_decision:
+                deadline = self.config.timeout * (self.config.max_retries + 1)
+                remaining = deadline - (time.monotonic() - start)
+                if remaining > 0:
+                    logger.info(
+                        "Retrying %d failed processors to reach %d responses",
+                        retryable_count, self.config.min_responses_for_decision
+                    )
+                    retry_tasks = [
+                        asyncio.create_task(
+                            self._make_single_request(
+                                model=model,
+                                messages=messages,
+                                response_format=actual_format,
+                                **kwargs
+                            )
+                        )
+                        for _ in range(retryable_count)
+                    ]
+                    # Each recovery request runs its own retry schedule, so
+                    # cap the whole batch at the budget left from the original
+                    # attempts and keep only what finished in time
+                    done, pending = await asyncio.wait(retry_tasks, timeout=remaining)
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        await asyncio.gather(*pending, return_exceptions=True)
+                    successful_results.extend(
+                        task.result() for task in done if task.exception() is None
+                    )
+
             if not successful_results:
                 raise ProcessingError("All parallel processors failed", failed_processors=failed_count)
             
@@ -184,42 +447,41 @@ class ParallelLLM:
             if len(responses) == 1:
                 return responses[0]
                 
-            # Prepare responses for decision maker
-            response_texts = []
-            for i, response in enumerate(responses):
-                if hasattr(response, 'model_dump_json'):
-                    response_json = response.model_dump_json(indent=2)
-                else:
-                    response_json = json.dumps(response, indent=2, default=str)
-                response_texts.append(f"Response {i+1}:\n{response_json}")
-            
-            # Add original context and responses
-            original_context = "\n".join([f"{msg['role']}: {msg['content']}" for msg in original_messages])
+            # Prepare responses for decision maker via orjson (Rust-backed,
+            # far faster than the stdlib encoder). Indented JSON roughly
+            # doubles both the serialization work and the prompt size, so only
+            # indent when debug logging wants readable output
+            indent_opt = orjson.OPT_INDENT_2 if logger.isEnabledFor(logging.DEBUG) else 0
+            if _estimate_payload_size(responses) > _SERIALIZE_OFFLOAD_THRESHOLD:
+                # Large payloads would hold the GIL long enough to stall the
+                # event loop while other responses are still being read
+                response_texts = await asyncio.get_running_loop().run_in_executor(
+                    None, _serialize_batch, responses, indent_opt
+                )
+            else:
+                response_texts = _serialize_batch(responses, indent_opt)
+
+            # Built exactly once per decision (retries in _make_single_request
+            # reuse the same messages), with generators feeding join directly
+            original_context = "\n".join(f"{msg['role']}: {msg['content']}" for msg in original_messages)
             all_responses = "\n\n".join(response_texts)
             
             decision_messages = [
-                {
-                    "role": "system", 
-                    "content": self.config.decision_maker_prompt
-                },
+                self._decision_system_msg,
                 {
                     "role": "user",
-                    "content": f"""Original Query Context:
-{original_context}
-
-All Responses to Analyze:
-{all_responses}
-
-Please analyze these responses and return the best one or synthesize a better response using the same format as the original responses."""
+                    "content": self._DECISION_USER_TMPL.format(
+                        ctx=original_context,
+                        resp=all_responses
+                    )
                 }
             ]
             
             # Decision maker always uses the original format
             decision_response = await self._make_single_request(
-                model=self.config.decision_maker_model,
                 messages=decision_messages,
                 response_format=response_format,
-                temperature=self.config.decision_maker_temperature
+                **self._decision_kwargs
             )
             
             return decision_response
@@ -239,18 +501,20 @@ Please analyze these responses and return the best one or synthesize a better re
         messages: List[Dict[str, str]],
         response_format: Type[BaseModel],
         pass_reasoning: bool = False,
+        trust_internal: bool = True,
         **kwargs
     ) -> Any:
         """
         Internal parse method that does the actual parallel processing.
-        
+
         Args:
             model: Model name to use
             messages: List of message dictionaries
             response_format: Pydantic model for structured output
             pass_reasoning: Whether to include reasoning in intermediate responses
+            trust_internal: Whether to trust intermediate responses and skip re-validation
             **kwargs: Additional parameters to pass to OpenAI API
-            
+
         Returns:
             Parsed response in the specified format
         """
@@ -264,7 +528,17 @@ Please analyze these responses and return the best one or synthesize a better re
                 raise ValidationError("Response format is required")
             if not issubclass(response_format, BaseModel):
                 raise ValidationError("Response format must be a Pydantic BaseModel")
-            
+
+            # Fast path: with a single processor there is nothing to fan out
+            # or decide between, so skip the task plumbing entirely
+            if self.config.num_processors == 1 and not pass_reasoning:
+                return await self._make_single_request(
+                    model=model,
+                    messages=messages,
+                    response_format=response_format,
+                    **kwargs
+                )
+
             # Step 1: Process parallel requests
             parallel_responses = await self._process_parallel_requests(
                 model=model,
@@ -281,10 +555,16 @@ Please analyze these responses and return the best one or synthesize a better re
                 original_messages=messages
             )
             
-            # Step 3: Validate the final response matches expected format
+            # Step 3: Coerce the final response to the expected format
             if not isinstance(final_response, response_format):
                 try:
-                    if hasattr(final_response, 'model_dump'):
+                    if hasattr(final_response, 'model_dump') and trust_internal:
+                        # The response was already validated by the OpenAI SDK at
+                        # parse time, so a full dump->validate round-trip would
+                        # only re-run every field validator for no benefit.
+                        # model_construct skips the validator pipeline entirely.
+                        final_response = response_format.model_construct(**final_response.model_dump())
+                    elif hasattr(final_response, 'model_dump'):
                         final_response = response_format.model_validate(final_response.model_dump())
                     else:
                         final_response = response_format.model_validate(final_response)
@@ -304,18 +584,20 @@ Please analyze these responses and return the best one or synthesize a better re
         messages: List[Dict[str, str]],
         response_format: Type[BaseModel],
         pass_reasoning: bool = False,
+        trust_internal: bool = True,
         **kwargs
     ) -> Any:
         """
         Direct method for parallel parsing (alternative to beta interface).
-        
+
         Args:
             model: Model name to use
             messages: List of message dictionaries
             response_format: Pydantic model for structured output
             pass_reasoning: Whether to include reasoning in intermediate responses for decision maker
+            trust_internal: Whether to trust intermediate responses and skip re-validation
             **kwargs: Additional parameters to pass to OpenAI API
-            
+
         Returns:
             Parsed response in the specified format (direct result, not wrapped)
         """
@@ -324,6 +606,7 @@ Please analyze these responses and return the best one or synthesize a better re
             messages=messages,
             response_format=response_format,
             pass_reasoning=pass_reasoning,
+            trust_internal=trust_internal,
             **kwargs
         )
 
@@ -331,6 +614,8 @@ Please analyze these responses and return the best one or synthesize a better re
     def update_config(self, **kwargs) -> None:
         """Update framework configuration."""
         self.config_manager.update_config(**kwargs)
+        self.config = self.config_manager.get_config()
+        self._rebuild_decision_cache()
     
     def get_config(self) -> FrameworkConfig:
         """Get current framework configuration."""
@@ -14,6 +14,8 @@ with open("requirements.txt", "r", encoding="utf-8") as f:
 core_requirements = [
     "openai>=1.35.0",
     "pydantic>=2.0.0",
+    "httpx[http2]>=0.27.0",
+    "orjson>=3.9.0",
     "asyncio-extras>=1.3.0",
 ]
 
@@ -55,6 +57,7 @@ setup(
         "extras": [
             "python-dotenv>=0.19.0",
             "rich>=13.0.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
         ],
     },
     entry_points={